@@ -15,6 +15,16 @@ from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, JSONResponse
 import aiofiles
 
+CREDENTIALS_PATH = Path("/root/.claude/.credentials.json")
+
+
+def credentials_present() -> bool:
+    """Return True if the Claude CLI has a non-empty stored credentials file."""
+    try:
+        return CREDENTIALS_PATH.stat().st_size > 0
+    except OSError:
+        return False
+
 # HTML template for authentication page with xterm.js
 AUTH_HTML = """
 <!DOCTYPE html>
@@ -247,9 +257,7 @@ def add_auth_routes(app):
     @app.get("/auth/status")
     async def auth_status():
         """Check if Claude CLI is authenticated."""
-        creds_path = Path("/root/.claude/.credentials.json")
-        authenticated = creds_path.exists() and creds_path.stat().st_size > 0
-        return JSONResponse({"authenticated": authenticated})
+        return JSONResponse({"authenticated": credentials_present()})
     
     @app.websocket("/auth/ws")
     async def websocket_endpoint(websocket: WebSocket):
@@ -0,0 +1,235 @@
+"""
+Readiness and liveness probes for the LiteLLM proxy.
+Warms the Claude CLI at startup and runs a periodic background canary so
+frequent health probes can be answered from cached state.
+"""
+
+import os
+import math
+import time
+import threading
+import subprocess
+from collections import deque
+from fastapi.responses import JSONResponse
+from auth_integration import credentials_present
+
+
+def _env_number(name: str, default, cast, minimum, maximum=86400):
+    """Read a numeric setting from the environment, falling back to the default when malformed."""
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = None
+    if value is None or not math.isfinite(value):
+        print(f"[READINESS] Ignoring invalid {name}={raw!r}, using {default}")
+        return default
+    if value < minimum:
+        print(f"[READINESS] {name}={value} is below the minimum, using {minimum}")
+        return minimum
+    if value > maximum:
+        print(f"[READINESS] {name}={value} is above the maximum, using {maximum}")
+        return maximum
+    return value
+
+
+# How often the canary runs and how long a single CLI invocation may take
+CANARY_INTERVAL = _env_number("CLAUDE_CANARY_INTERVAL", 60.0, float, 5.0)
+CANARY_TIMEOUT = _env_number("CLAUDE_CANARY_TIMEOUT", 30.0, float, 1.0)
+
+# Consecutive canary failures before liveness reports the replica as dead
+CANARY_FAILURE_THRESHOLD = _env_number("CLAUDE_CANARY_FAILURE_THRESHOLD", 3, int, 1)
+
+
+# Cached results older than this mean the monitor thread has stalled
+STALE_AFTER = 3 * CANARY_INTERVAL + CANARY_TIMEOUT
+
+
+class ReadinessState:
+    """Thread-safe snapshot of warm-up progress and canary results."""
+
+    def __init__(self, history_size: int = 20):
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._warm = False
+        self._warmup_failed = False
+        self._warmup_steps = {}
+        self._authenticated = False
+        self._last_canary_at = None
+        self._last_canary_ok = None
+        self._consecutive_failures = 0
+        self._latencies = deque(maxlen=history_size)
+
+    def record_step(self, name: str, seconds: float):
+        with self._lock:
+            self._warmup_steps[name] = round(seconds, 3)
+
+    def finish_warmup(self, ok: bool):
+        with self._lock:
+            self._warm = ok
+            self._warmup_failed = not ok
+
+    def set_authenticated(self, authenticated: bool):
+        with self._lock:
+            self._authenticated = authenticated
+
+    def record_canary(self, ok: bool, seconds: float):
+        with self._lock:
+            self._last_canary_at = time.time()
+            self._last_canary_ok = ok
+            if ok:
+                self._consecutive_failures = 0
+                self._latencies.append(round(seconds, 3))
+            else:
+                self._consecutive_failures += 1
+
+    def is_warm(self) -> bool:
+        with self._lock:
+            return self._warm
+
+    def consecutive_failures(self) -> int:
+        with self._lock:
+            return self._consecutive_failures
+
+    def warmup_steps(self) -> dict:
+        with self._lock:
+            return dict(self._warmup_steps)
+
+    def _is_stale(self) -> bool:
+        last_seen = self._last_canary_at or self._started_at
+        return time.time() - last_seen > STALE_AFTER
+
+    def is_ready(self) -> bool:
+        with self._lock:
+            return (
+                self._warm
+                and self._authenticated
+                and self._last_canary_ok is not False
+                and not self._is_stale()
+            )
+
+    def is_alive(self) -> bool:
+        with self._lock:
+            return self._consecutive_failures < CANARY_FAILURE_THRESHOLD and not self._is_stale()
+
+    def snapshot(self) -> dict:
+        """Probe-safe summary; error details only go to the server log."""
+        with self._lock:
+            latencies = list(self._latencies)
+            return {
+                "warm": self._warm,
+                "warmup_failed": self._warmup_failed,
+                "warmup_steps": dict(self._warmup_steps),
+                "authenticated": self._authenticated,
+                "uptime_seconds": round(time.time() - self._started_at, 1),
+                "canary": {
+                    "last_run_at": self._last_canary_at,
+                    "last_ok": self._last_canary_ok,
+                    "consecutive_failures": self._consecutive_failures,
+                    "last_latency_seconds": latencies[-1] if latencies else None,
+                    "avg_latency_seconds": round(sum(latencies) / len(latencies), 3) if latencies else None,
+                    "interval_seconds": CANARY_INTERVAL,
+                },
+            }
+
+
+state = ReadinessState()
+
+
+def run_cli_canary():
+    """Invoke the Claude CLI without touching the API; returns (ok, seconds, error)."""
+    started = time.monotonic()
+    try:
+        result = subprocess.run(
+            ["claude", "--version"],
+            capture_output=True,
+            text=True,
+            timeout=CANARY_TIMEOUT,
+        )
+    except Exception as e:
+        return False, time.monotonic() - started, str(e)
+
+    elapsed = time.monotonic() - started
+    if result.returncode != 0:
+        return False, elapsed, (result.stderr or result.stdout).strip() or f"exit code {result.returncode}"
+    return True, elapsed, None
+
+
+def warm_up(cli_result=None):
+    """Load the SDK, launch the CLI once and check for stored credentials.
+
+    Pass a successful ``run_cli_canary()`` result as ``cli_result`` to reuse it
+    instead of launching the CLI again.
+    """
+    try:
+        started = time.monotonic()
+        import claude_code_sdk  # noqa: F401
+        state.record_step("sdk_import", time.monotonic() - started)
+
+        # First CLI launch reads the CLI bundle from disk and, with
+        # NODE_COMPILE_CACHE set, writes V8 code cache that later SDK spawns reuse
+        if cli_result is None:
+            cli_result = run_cli_canary()
+            state.record_canary(cli_result[0], cli_result[1])
+        ok, elapsed, error = cli_result
+        state.record_step("cli_launch", elapsed)
+        if not ok:
+            raise RuntimeError(f"Claude CLI warm-up failed: {error}")
+
+        started = time.monotonic()
+        state.set_authenticated(credentials_present())
+        state.record_step("credentials_present", time.monotonic() - started)
+    except Exception as e:
+        print(f"[READINESS] Warm-up failed: {e}")
+        state.finish_warmup(False)
+        return
+
+    state.finish_warmup(True)
+    print(f"[READINESS] Warm-up complete: {state.warmup_steps()}")
+
+
+def canary_loop(stop_event: threading.Event):
+    """Warm up once, then re-run the CLI canary every CANARY_INTERVAL seconds."""
+    warm_up()
+    while not stop_event.wait(CANARY_INTERVAL):
+        try:
+            result = run_cli_canary()
+            ok, elapsed, error = result
+            state.record_canary(ok, elapsed)
+            state.set_authenticated(credentials_present())
+            if not ok:
+                print(f"[READINESS] Canary failed ({state.consecutive_failures()} in a row): {error}")
+            elif not state.is_warm():
+                # CLI recovered after a failed warm-up; reuse this launch rather than spawning again
+                print("[READINESS] Claude CLI recovered, retrying warm-up")
+                warm_up(cli_result=result)
+        except Exception as e:
+            print(f"[READINESS] Canary iteration failed: {e}")
+
+
+def start_readiness_monitor() -> threading.Event:
+    """Start warm-up and the canary in a daemon thread; set the returned event to stop it."""
+    stop_event = threading.Event()
+    thread = threading.Thread(target=canary_loop, args=(stop_event,), name="claude-readiness", daemon=True)
+    thread.start()
+    return stop_event
+
+
+def add_readiness_routes(app):
+    """Add cached readiness and liveness endpoints to the LiteLLM FastAPI app."""
+
+    @app.get("/ready")
+    async def ready():
+        """Report ready once warm-up has finished, credentials exist and the last canary passed."""
+        status_code = 200 if state.is_ready() else 503
+        return JSONResponse(state.snapshot(), status_code=status_code)
+
+    @app.get("/live")
+    async def live():
+        """Cheap liveness signal served from cached canary results."""
+        alive = state.is_alive()
+        return JSONResponse({"alive": alive}, status_code=200 if alive else 503)
+
+    return app
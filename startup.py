@@ -76,5 +76,11 @@ if __name__ == "__main__":
     app = add_auth_routes(app)
     print("[STARTUP] Added authentication routes to LiteLLM")
     
+    # Add readiness probes and warm the Claude CLI before traffic arrives
+    from readiness import add_readiness_routes, start_readiness_monitor
+    app = add_readiness_routes(app)
+    start_readiness_monitor()
+    print("[STARTUP] Added readiness routes and started Claude CLI warm-up")
+    
     # Start the server
     uvicorn.run(app, host="0.0.0.0", port=4000)
\ No newline at end of file